@@ -1,36 +1,131 @@
 import streamlit as st
 import base64
+import json
+import os
 import random
+import threading
 import time
 import fitz
 from datetime import datetime
 from pathlib import Path
 
+from pdf_tile_store import TileStore, file_digest
+
 # Define the repository's root directory
 repo_root = Path(__file__).parent
 
-# Create the custom sun yellow icon with document
-def display_pdf(file_path):
-    """Display PDF content in the right panel."""
-    try:
-        # Open the PDF file
-        pdf_document = fitz.open(file_path)
-        pdf_pages = []
+# PDF viewer settings: pages shown per screen, render zoom, thumbnail zoom
+PDF_PAGES_PER_VIEW = 3
+PDF_ZOOM = 1.5
+PDF_THUMBNAIL_ZOOM = 0.3
+PDF_PAGE_CACHE_ENTRIES = 64
+
+# MuPDF documents are not thread-safe and Streamlit sessions run in threads
+_pdf_lock = threading.Lock()
+
+@st.cache_resource
+def get_tile_store():
+    """Pre-rendered page store shared by every session."""
+    return TileStore(repo_root / "tile_store", zoom=PDF_ZOOM, thumbnail_zoom=PDF_THUMBNAIL_ZOOM)
+
+@st.cache_resource(max_entries=8)
+def start_prerender(file_path, mtime):
+    """Render every page into the store in the background, once per file version."""
+    thread = threading.Thread(target=get_tile_store().prerender, args=(file_path,), daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def pdf_digest(file_path, mtime):
+    """SHA-256 of a PDF, hashed once per file version."""
+    return file_digest(file_path)
+
+def load_page_manifest(file_path, mtime):
+    """Page manifest for a PDF, or None while its pages are still being pre-rendered."""
+    manifest_path = get_tile_store().manifest_path(pdf_digest(file_path, mtime))
+    if manifest_path.exists():
+        return json.loads(manifest_path.read_text())
+    start_prerender(file_path, mtime)
+    return None
+
+@st.cache_resource(max_entries=8)
+def open_pdf(file_path, mtime):
+    """Keep one open document handle per file version across reruns and sessions."""
+    return fitz.open(file_path)
+
+@st.cache_data(max_entries=PDF_PAGE_CACHE_ENTRIES, show_spinner=False)
+def render_pdf_page(file_path, page_number, zoom, mtime):
+    """Rasterize one page to PNG; LRU-cached by (file, page, zoom, mtime)."""
+    pdf_document = open_pdf(file_path, mtime)
+    with _pdf_lock:
+        page = pdf_document[page_number]
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        return pix.tobytes("png")
 
-        # Extract each page as an image
-        for page_number in range(len(pdf_document)):
-            page = pdf_document[page_number]
-            pix = page.get_pixmap()
-            img_data = pix.tobytes("png")
-            pdf_pages.append(img_data)
+def display_pdf(file_path):
+    """Display a window of PDF pages in the right panel.
 
-        # Render pages in Streamlit
-        for page_image in pdf_pages:
-            st.image(page_image, use_container_width=True)
+    Pages come from the tile store once the document is pre-rendered; until
+    then only the visible pages are rendered, on demand.
+    """
+    try:
+        start_time = time.perf_counter()
+        tile_store = get_tile_store()
+        mtime = os.path.getmtime(file_path)
+        manifest = load_page_manifest(file_path, mtime)
+        page_count = manifest["page_count"] if manifest else len(open_pdf(file_path, mtime))
+
+        def page_image(page_number, kind, zoom):
+            if manifest:
+                return str(tile_store.object_path(manifest["pages"][page_number][kind]))
+            return render_pdf_page(file_path, page_number, zoom, mtime)
+
+        # Paging controls; the visible window is kept per document
+        page_key = f"pdf_page_{file_path}"
+        if page_key not in st.session_state:
+            st.session_state[page_key] = 0
+        first_page = st.session_state[page_key]
+
+        prev_col, info_col, next_col = st.columns([1, 2, 1])
+        with prev_col:
+            if st.button("◀ Previous", key=f"{page_key}_prev", disabled=first_page == 0):
+                first_page = max(0, first_page - PDF_PAGES_PER_VIEW)
+        with next_col:
+            if st.button("Next ▶", key=f"{page_key}_next",
+                         disabled=first_page + PDF_PAGES_PER_VIEW >= page_count):
+                first_page = min(page_count - 1, first_page + PDF_PAGES_PER_VIEW)
+        with info_col:
+            jump_to = st.number_input(
+                f"Page (of {page_count})", min_value=1, max_value=page_count,
+                value=first_page + 1, key=f"{page_key}_jump_{first_page}"
+            )
+            first_page = jump_to - 1
+        st.session_state[page_key] = first_page
+
+        visible_pages = range(first_page, min(first_page + PDF_PAGES_PER_VIEW, page_count))
+
+        # Low-DPI thumbnails first so the panel fills immediately; stored
+        # pages are handed to Streamlit as PNG file paths
+        placeholders = []
+        for page_number in visible_pages:
+            placeholder = st.empty()
+            placeholder.image(page_image(page_number, "thumbnail", PDF_THUMBNAIL_ZOOM), use_container_width=True)
+            placeholders.append(placeholder)
+
+        # Then swap in the full-resolution pages
+        for placeholder, page_number in zip(placeholders, visible_pages):
+            placeholder.image(page_image(page_number, "image", PDF_ZOOM), use_container_width=True)
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        st.caption(
+            f"Pages {first_page + 1}-{visible_pages[-1] + 1} of {page_count} "
+            f"{'served' if manifest else 'rendered'} in {elapsed_ms:.0f} ms"
+        )
 
     except Exception as e:
         st.error(f"Error loading PDF: {e}")
 
+# Create the custom sun yellow icon with document
 SUN_ICON = """
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
   <!-- Sun circle -->
@@ -1,19 +1,32 @@
+import asyncio
 import logging
+import time
 from abc import ABC
-from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
 
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
+from .bulk import BulkLoadStats, Row, Rows, pipelined_chunks
+from .cache import ResultCache, cache_key, table_tags
 from .exceptions import DatabaseError, ConnectionError, QueryExecutionError
-from .utils import with_retry
+from .dbutils import RetryPolicy, with_retry
+from .instrumentation import QueryHook, QueryMetrics, current_metrics, instrumented
+from .pool import TimedQueuePool
+from .replicas import Replica, ReplicaSet
 
 logger = logging.getLogger(__name__)
 
 class AsyncDB(ABC):
     """Base class for all database implementations"""
+    # Cheapest round trip, used to probe ejected replicas
+    ping_query = "SELECT 1"
+
     def __init__(
             self,
             dsn: str,
@@ -21,16 +34,59 @@ class AsyncDB(ABC):
             max_retries: int = 3,
             log_queries: bool = True,
             log_params: bool = False,
+            text_cache_size: int = 256,
+            pool_size: int = 5,
+            max_overflow: int = 10,
+            pool_timeout: float = 30,
+            pool_recycle: int = -1,
+            pool_pre_ping: bool = False,
+            pool_use_lifo: bool = False,
+            replica_dsns: Sequence[str] = (),
+            replica_balancing: str = "round_robin",
+            replica_health_interval: float = 30.0,
+            instrumentation: Optional[QueryHook] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            result_cache: Optional[ResultCache] = None,
             **engine_kwargs
     ):
         self.dsn = dsn
         self.max_retries = max_retries
+        # One policy per instance, so its budget and breaker cover every call
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
         self.log_queries = log_queries
         self.log_params = log_params
+        self.pool_size = pool_size
+        self.instrumentation = instrumentation
+        self.result_cache = result_cache
+        # Hot queries reuse one TextClause instead of re-parsing the SQL string
+        self._text = lru_cache(maxsize=text_cache_size)(text)
+        poolclass = engine_kwargs.setdefault("poolclass", TimedQueuePool)
+        if issubclass(poolclass, QueuePool):
+            engine_kwargs.update(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+                pool_pre_ping=pool_pre_ping,
+                pool_use_lifo=pool_use_lifo,
+            )
         self.engine = create_async_engine(dsn, **engine_kwargs)
         self.async_session = sessionmaker(
             self.engine, expire_on_commit=False, class_=AsyncSession
         )
+        # Reads go to replicas; writes and transactions stay on the primary
+        self.replicas = ReplicaSet(
+            [self._create_replica(r, engine_kwargs) for r in replica_dsns],
+            balancing=replica_balancing,
+            health_check=self._ping,
+            health_interval=replica_health_interval
+        )
+
+    def _create_replica(self, dsn: str, engine_kwargs: Dict[str, Any]) -> Replica:
+        engine = create_async_engine(dsn, **engine_kwargs)
+        return Replica(
+            dsn, engine, sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+        )
 
     def _log_query(self, query: str, params: Any = None) -> None:
         """Log query with optional parameters"""
@@ -44,10 +100,41 @@ class AsyncDB(ABC):
 
         logger.debug(log_message)
 
+    def text_cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters of the compiled TextClause cache"""
+        info = self._text.cache_info()
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+
     def _handle_exception(self, e: Exception) -> None:
         """Database-specific exception handling (to be implemented by subclasses)"""
         raise NotImplementedError
 
+    @staticmethod
+    def _driver_error(e: Exception) -> Exception:
+        """The DB-API exception SQLAlchemy wrapped in a DBAPIError, or ``e`` itself"""
+        if isinstance(e, DBAPIError) and e.orig is not None:
+            return e.orig
+        return e
+
+    def _is_connection_failure(self, e: Exception) -> bool:
+        """Server unreachable or connection lost, as opposed to a failing statement.
+
+        Checkout failures that the driver raises as plain OSErrors (refused,
+        reset, timed out) reach us unwrapped; the rest arrive as interface or
+        operational DBAPIErrors, or with the connection invalidated.
+        """
+        if isinstance(e, DBAPIError) and (
+                e.connection_invalidated or isinstance(e, (InterfaceError, OperationalError))
+        ):
+            return True
+        return isinstance(self._driver_error(e), OSError)
+
+    @instrumented("execute")
     @with_retry
     async def execute(
             self,
@@ -59,7 +146,7 @@ class AsyncDB(ABC):
 
         try:
             async with self.async_session() as session:
-                result = await session.execute(text(query), params or {})
+                result = await session.execute(self._text(query), params or {})
                 if fetch:
                     return result.mappings().all()
                 await session.commit()
@@ -67,52 +154,302 @@ class AsyncDB(ABC):
         except Exception as e:
             self._handle_exception(e)
 
+    @instrumented("execute_many")
     @with_retry
     async def execute_many(
             self,
             query: str,
             params_list: List[Union[Dict, List, Tuple]]
-    ) -> None:
+    ) -> int:
         self._log_query(query, params_list)
 
         try:
             async with self.async_session() as session:
-                stmt = text(query)
-                await session.execute(stmt, params_list)
+                stmt = self._text(query)
+                result = await session.execute(stmt, params_list)
                 await session.commit()
+                return result.rowcount
+        except Exception as e:
+            self._handle_exception(e)
+
+    async def bulk_insert(
+            self,
+            table: str,
+            rows: Rows,
+            *,
+            columns: Optional[Sequence[str]] = None,
+            chunk_size: int = 10_000
+    ) -> BulkLoadStats:
+        """Insert rows (dicts) from a sync or async iterable in committed chunks.
+
+        The next chunk is built while the previous one is being written, and
+        each chunk runs in its own transaction so a large load never holds
+        one long transaction or the whole parameter list in memory.
+        """
+        stats = BulkLoadStats()
+        start = time.perf_counter()
+
+        async for chunk in pipelined_chunks(rows, chunk_size):
+            if columns is None:
+                columns = list(chunk[0].keys())
+            inserted, errors = await self._load_chunk(table, columns, chunk)
+            stats.rows += inserted
+            stats.chunks += 1
+            stats.errors.extend(errors)
+            stats.seconds = time.perf_counter() - start
+            logger.debug(
+                f"Bulk insert into {table}: chunk {stats.chunks}, "
+                f"{stats.rows} rows, {stats.rows_per_sec:.0f} rows/sec"
+            )
+
+        stats.seconds = time.perf_counter() - start
+        logger.info(
+            f"Bulk insert into {table} finished: {stats.rows} rows in "
+            f"{stats.seconds:.2f}s ({stats.rows_per_sec:.0f} rows/sec), "
+            f"{len(stats.errors)} row errors"
+        )
+        return stats
+
+    @with_retry
+    async def _load_chunk(
+            self,
+            table: str,
+            columns: Sequence[str],
+            chunk: List[Row]
+    ) -> Tuple[int, List[Any]]:
+        self._log_query(f"BULK INSERT INTO {table} ({len(chunk)} rows)")
+
+        try:
+            return await self._insert_chunk(table, columns, chunk)
         except Exception as e:
             self._handle_exception(e)
 
+    async def _insert_chunk(
+            self,
+            table: str,
+            columns: Sequence[str],
+            chunk: List[Row]
+    ) -> Tuple[int, List[Any]]:
+        """Write one chunk and commit; returns (rows inserted, per-row errors).
+
+        Backends override this with their native bulk path.
+        """
+        query = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join(':' + c for c in columns)})"
+        )
+        async with self.async_session() as session:
+            await session.execute(self._text(query), chunk)
+            await session.commit()
+        return len(chunk), []
+
+    @instrumented("fetch_all")
     async def fetch_all(
+            self,
+            query: str,
+            params: Optional[Union[Dict, List, Tuple]] = None,
+            *,
+            cache_ttl: Optional[float] = None,
+            cache_tags: Sequence[str] = ()
+    ) -> List[Dict]:
+        """Fetch all rows, from ``result_cache`` when one is configured.
+
+        Results are cached for ``cache_ttl`` seconds (default: the cache's
+        ``default_ttl``; no TTL means not cached) and tagged with the tables
+        the query reads plus ``cache_tags``.
+        """
+        ttl = None
+        if self.result_cache is not None:
+            ttl = cache_ttl if cache_ttl is not None else self.result_cache.default_ttl
+        if not ttl:
+            return await self._fetch_all(query, params)
+
+        key = cache_key(query, params)
+        cached = await self._cache_call(self.result_cache.get, key)
+        if cached is not None:
+            return cached
+        rows = await self._fetch_all(query, params)
+        return await self._cache_call(self.result_cache.set, key, rows, ttl, table_tags(query) | set(cache_tags))
+
+    async def _cache_call(self, func, *args):
+        """Run a result cache call, off the event loop when its backend blocks"""
+        if getattr(self.result_cache.backend, "blocking", True):
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def _fetch_all(
             self,
             query: str,
             params: Optional[Union[Dict, List, Tuple]] = None
     ) -> List[Dict]:
-        result = await self.execute(query, params, fetch=True)
-        return result
+        replica = self.replicas.acquire() if self.replicas else None
+        if replica is None:
+            return await self.execute(query, params, fetch=True)
 
-    async def fetch_one(
+        try:
+            return await self._fetch_from_replica(replica, query, params)
+        except ConnectionError:
+            self.replicas.eject(replica)
+            return await self.execute(query, params, fetch=True)
+        finally:
+            self.replicas.release(replica)
+
+    def invalidate_cache(self, *tables: str) -> int:
+        """Drop cached results that read any of ``tables``"""
+        if self.result_cache is None:
+            return 0
+        return self.result_cache.invalidate(*tables)
+
+    async def _fetch_from_replica(
             self,
+            replica: Replica,
             query: str,
             params: Optional[Union[Dict, List, Tuple]] = None
+    ) -> List[Dict]:
+        self._log_query(query, params)
+
+        try:
+            async with replica.async_session() as session:
+                result = await session.execute(self._text(query), params or {})
+                return result.mappings().all()
+        except Exception as e:
+            self._handle_exception(e)
+
+    async def _ping(self, replica: Replica) -> None:
+        async with replica.engine.connect() as conn:
+            await conn.exec_driver_sql(self.ping_query)
+
+    async def stream(
+            self,
+            query: str,
+            params: Optional[Union[Dict, List, Tuple]] = None,
+            *,
+            batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict]]:
+        """Yield result rows in batches using a server-side cursor.
+
+        Unlike ``fetch_all`` only one batch is held in memory at a time.
+        Streams are not retried: a failure part-way through would replay
+        rows the caller has already consumed.
+        """
+        self._log_query(query, params)
+
+        try:
+            async with self.async_session() as session:
+                result = await session.stream(
+                    self._text(query),
+                    params or {},
+                    execution_options=self._stream_options(batch_size)
+                )
+                async for batch in result.mappings().partitions(batch_size):
+                    yield batch
+        except Exception as e:
+            self._handle_exception(e)
+
+    def _stream_options(self, batch_size: int) -> Dict[str, Any]:
+        """Execution options for streamed queries (overridable per backend)"""
+        return {"yield_per": batch_size}
+
+    @instrumented("fetch_one")
+    async def fetch_one(
+            self,
+            query: str,
+            params: Optional[Union[Dict, List, Tuple]] = None,
+            **cache_options
     ) -> Optional[Dict]:
-        result = await self.fetch_all(query, params)
+        result = await self.fetch_all(query, params, **cache_options)
         return result[0] if result else None
 
+    async def gather_queries(
+            self,
+            queries: Sequence[Union[str, Tuple[str, Optional[Union[Dict, List, Tuple]]]]],
+            *,
+            max_concurrency: Optional[int] = None,
+            fetch_one: bool = False
+    ) -> List[Any]:
+        """Run independent reads concurrently, returning results in input order.
+
+        Each item is a SQL string or a ``(query, params)`` pair. A failing
+        query does not cancel the others: its exception is returned in its
+        slot. Concurrency is capped at the pool size so the fan-out never
+        queues behind its own checkouts or spills into overflow connections.
+        """
+        limit = min(max_concurrency or self.pool_size, self.pool_size)
+        semaphore = asyncio.Semaphore(max(limit, 1))
+        fetch = self.fetch_one if fetch_one else self.fetch_all
+
+        async def run(item):
+            query, params = (item, None) if isinstance(item, str) else item
+            async with semaphore:
+                return await fetch(query, params)
+
+        return await asyncio.gather(*(run(item) for item in queries), return_exceptions=True)
+
+    async def warm_up(self, n: Optional[int] = None) -> int:
+        """Open up to ``n`` pooled connections ahead of the first requests.
+
+        Warms the primary and every healthy replica, each up to its
+        configured pool size; returns the number opened. A replica that
+        cannot connect is ejected rather than failing the warm-up.
+        """
+        replicas = [r for r in self.replicas.replicas if r.healthy]
+        opened = await asyncio.gather(
+            self._warm_pool(self.engine, n),
+            *(self._warm_pool(replica.engine, n) for replica in replicas),
+            return_exceptions=True
+        )
+        if isinstance(opened[0], BaseException):
+            raise opened[0]
+        for replica, result in zip(replicas, opened[1:]):
+            if isinstance(result, BaseException):
+                logger.warning(f"Warm-up of read replica {replica.name} failed: {result}")
+                self.replicas.eject(replica)
+        total = sum(result for result in opened if not isinstance(result, BaseException))
+        logger.info(f"Warmed up {total} pooled connections")
+        return total
+
+    @staticmethod
+    async def _warm_pool(engine, n: Optional[int]) -> int:
+        pool = engine.pool
+        n = min(n or pool.size(), pool.size())
+        async with AsyncExitStack() as stack:
+            await asyncio.gather(*(stack.enter_async_context(engine.connect()) for _ in range(n)))
+        return n
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Checked-out/idle/overflow connections and checkout wait times"""
+        pool = self.engine.pool
+        if isinstance(pool, TimedQueuePool):
+            return pool.stats()
+        return {"status": pool.status()}
+
     async def close(self) -> None:
+        await self.replicas.close()
         if self.engine:
             await self.engine.dispose()
 
     @asynccontextmanager
     async def transaction(self) -> AsyncIterator:
         """Context manager for transactional operations"""
+        metrics = token = None
+        if self.instrumentation is not None and current_metrics.get() is None:
+            metrics = QueryMetrics("transaction", "TRANSACTION")
+            token = current_metrics.set(metrics)
+            start = time.perf_counter()
+
         session = self.async_session()
         try:
             yield session
             await session.commit()
         except Exception as e:
+            if metrics is not None:
+                metrics.error = type(e).__name__
             await session.rollback()
             logger.error(f"Transaction rolled back: {str(e)}")
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+            if metrics is not None:
+                metrics.wall_time = time.perf_counter() - start
+                current_metrics.reset(token)
+                self.instrumentation.on_query(metrics)
\ No newline at end of file
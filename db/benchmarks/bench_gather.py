@@ -0,0 +1,42 @@
+"""``AsyncDB.gather_queries`` against sequential awaits of ``fetch_one``.
+
+Run with ``python -m db.benchmarks.bench_gather [lookups] [pool_size] [latency_ms]``.
+Each lookup pauses ``latency_ms`` inside SQLite to model the round trip to
+Oracle/PostgreSQL, which is what concurrent fan-out overlaps.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+from .common import SQLiteDB, seed_rows, timed
+
+QUERY = (
+    "SELECT id, attribute, value, pause(:latency_ms) AS rtt "
+    "FROM bench_rows WHERE facility_id = :facility_id LIMIT 1"
+)
+
+async def main(lookups: int = 500, pool_size: int = 8, latency_ms: int = 5) -> None:
+    params = [
+        {"facility_id": f"FAC-{i % 997:05d}", "latency_ms": latency_ms} for i in range(lookups)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = SQLiteDB(os.path.join(tmp, "bench.db"), pool_size=pool_size)
+        try:
+            await seed_rows(db, 10_000)
+            await db.warm_up()
+
+            with timed(f"sequential ({lookups} lookups)"):
+                sequential = [await db.fetch_one(QUERY, p) for p in params]
+            with timed(f"gather_queries (max_concurrency={pool_size})"):
+                gathered = await db.gather_queries(
+                    [(QUERY, p) for p in params], fetch_one=True
+                )
+            assert gathered == sequential
+            print(db.pool_stats())
+        finally:
+            await db.close()
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,44 @@
+"""Peak memory of ``AsyncDB.stream`` against ``AsyncDB.fetch_all``.
+
+Run with ``python -m db.benchmarks.bench_stream [rows] [batch_size]``.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from .common import SQLiteDB, seed_rows, timed
+
+QUERY = "SELECT * FROM bench_rows"
+
+async def _fetch_all(db: SQLiteDB) -> int:
+    rows = await db.fetch_all(QUERY)
+    return len(rows)
+
+async def _stream(db: SQLiteDB, batch_size: int) -> int:
+    count = 0
+    async for batch in db.stream(QUERY, batch_size=batch_size):
+        count += len(batch)
+    return count
+
+async def _measure(label: str, coro) -> None:
+    tracemalloc.start()
+    with timed(label):
+        count = await coro
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label}: {count} rows, peak {peak / 1024 / 1024:.1f} MiB")
+
+async def main(rows: int = 200_000, batch_size: int = 1000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = SQLiteDB(os.path.join(tmp, "bench.db"))
+        try:
+            await seed_rows(db, rows)
+            await _measure("fetch_all", _fetch_all(db))
+            await _measure(f"stream(batch_size={batch_size})", _stream(db, batch_size))
+        finally:
+            await db.close()
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:])))
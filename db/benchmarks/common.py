@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import event
+
+from ..base import AsyncDB
+from ..exceptions import DatabaseError
+
+class SQLiteDB(AsyncDB):
+    """Local stand-in for OracleDB/PostgresDB used by the benchmarks"""
+    def __init__(self, path: str, **kwargs):
+        super().__init__(f"sqlite+aiosqlite:///{path}", log_queries=False, **kwargs)
+        # pause(ms) stands in for the server round trip of a networked database
+        event.listen(self.engine.sync_engine, "connect", _register_pause)
+
+    def _handle_exception(self, e: Exception) -> None:
+        raise DatabaseError from e
+
+def _register_pause(dbapi_connection, connection_record) -> None:
+    dbapi_connection.create_function("pause", 1, lambda ms: time.sleep(ms / 1000) or 0)
+
+async def seed_rows(db: AsyncDB, rows: int, table: str = "bench_rows") -> None:
+    """Create ``table`` and fill it with ``rows`` synthetic extract rows"""
+    await db.execute(f"DROP TABLE IF EXISTS {table}")
+    await db.execute(
+        f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, facility_id TEXT, attribute TEXT, value TEXT)"
+    )
+    if not rows:
+        return
+    await db.execute_many(
+        f"INSERT INTO {table} VALUES (:id, :facility_id, :attribute, :value)",
+        [
+            {
+                "id": i,
+                "facility_id": f"FAC-{i % 997:05d}",
+                "attribute": f"ATTR_{i % 50}",
+                "value": "x" * 64,
+            }
+            for i in range(rows)
+        ]
+    )
+
+@contextmanager
+def timed(label: str) -> Iterator[None]:
+    start = time.perf_counter()
+    yield
+    print(f"{label}: {time.perf_counter() - start:.3f}s")
@@ -0,0 +1,68 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Union
+
+Row = Dict[str, Any]
+Rows = Union[Iterable[Row], AsyncIterable[Row]]
+
+@dataclass
+class BulkLoadStats:
+    """Outcome of an ``AsyncDB.bulk_insert`` run"""
+    rows: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+    errors: List[Any] = field(default_factory=list)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+async def iter_chunks(rows: Rows, chunk_size: int) -> AsyncIterator[List[Row]]:
+    """Group a sync or async iterable of rows into lists of ``chunk_size``"""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    chunk: List[Row] = []
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+                # Let the in-flight insert make progress between chunks
+                await asyncio.sleep(0)
+    if chunk:
+        yield chunk
+
+async def pipelined_chunks(rows: Rows, chunk_size: int, depth: int = 1) -> AsyncIterator[List[Row]]:
+    """Like ``iter_chunks`` but builds up to ``depth`` chunks ahead in a background task"""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=depth)
+    done = object()
+
+    async def produce() -> None:
+        try:
+            async for chunk in iter_chunks(rows, chunk_size):
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(done)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
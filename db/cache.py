@@ -0,0 +1,226 @@
+import hashlib
+import json
+import logging
+import pickle
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TABLE_REFERENCES = re.compile(r'\b(?:FROM|JOIN)\s+([\w$#."]+)', re.IGNORECASE)
+
+def table_tags(query: str) -> Set[str]:
+    """Tables a SELECT reads from, used as invalidation tags.
+
+    Schema-qualified names are tagged both with and without the schema.
+    """
+    tags = set()
+    for name in _TABLE_REFERENCES.findall(query):
+        name = name.replace('"', "").upper()
+        tags.add(name)
+        tags.add(name.rpartition(".")[2])
+    return tags
+
+def cache_key(query: str, params: Any) -> str:
+    payload = json.dumps([query, params], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class MemoryCacheBackend:
+    """In-process LRU bounded by the pickled size of the cached results"""
+    # Cheap and not thread-safe: AsyncDB calls it on the event loop
+    blocking = False
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes_held = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes, Set[str]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value, _ = entry
+        if expires < time.time():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str]) -> None:
+        if len(value) > self.max_bytes:
+            return
+        self._remove(key)
+        tags = set(tags)
+        self._entries[key] = (time.time() + ttl, value, tags)
+        self.bytes_held += len(value)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while self.bytes_held > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tag: str) -> int:
+        keys = self._tags.pop(tag, set())
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+        self.bytes_held = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        _, value, tags = entry
+        self.bytes_held -= len(value)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+class DiskCacheBackend:
+    """LRU in a local SQLite file (WAL mode) that worker processes can share"""
+    # SQLite reads and committed writes: AsyncDB runs them in a worker thread
+    blocking = True
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY, value BLOB, size INTEGER, expires REAL, accessed REAL
+            );
+            CREATE TABLE IF NOT EXISTS entry_tags (
+                tag TEXT, key TEXT, PRIMARY KEY (tag, key)
+            );
+            CREATE INDEX IF NOT EXISTS entry_tags_key ON entry_tags (key);
+            CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+        """)
+
+    @property
+    def bytes_held(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._delete([key])
+                return None
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Iterable[str]) -> None:
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM entry_tags WHERE key = ?", (key,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (key, value, len(value), now + ttl, now)
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entry_tags VALUES (?, ?)", [(tag, key) for tag in tags]
+                )
+                self._evict()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def invalidate(self, tag: str) -> int:
+        with self._lock:
+            keys = [row[0] for row in self._conn.execute(
+                "SELECT key FROM entry_tags WHERE tag = ?", (tag,)
+            )]
+            self._delete(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM entry_tags")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _delete(self, keys: List[str]) -> None:
+        for key in keys:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.execute("DELETE FROM entry_tags WHERE key = ?", (key,))
+
+    def _evict(self) -> None:
+        self._conn.execute("DELETE FROM entries WHERE expires < ?", (time.time(),))
+        held = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if held <= self.max_bytes:
+            return
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            victims.append(key)
+            held -= size
+            if held <= self.max_bytes:
+                break
+        self._delete(victims)
+        self._conn.execute("DELETE FROM entry_tags WHERE key NOT IN (SELECT key FROM entries)")
+
+class ResultCache:
+    """Read-through cache for AsyncDB.fetch_all/fetch_one results.
+
+    Entries are keyed by SQL text plus parameters and tagged with the
+    tables the query reads, so ``invalidate("WL_APP.WL_DATA_CONCEPT")``
+    drops every cached read of that table.
+    """
+    def __init__(self, backend=None, default_ttl: Optional[float] = None):
+        self.backend = backend or MemoryCacheBackend()
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(value)
+
+    def set(self, key: str, rows: List[Any], ttl: float, tags: Iterable[str]) -> List[Dict]:
+        rows = [dict(row) for row in rows]
+        self.backend.set(key, pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL), ttl, tags)
+        return rows
+
+    def invalidate(self, *tables: str) -> int:
+        removed = sum(self.backend.invalidate(table.replace('"', "").upper()) for table in tables)
+        logger.debug(f"Invalidated {removed} cached results for {', '.join(tables)}")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "bytes_held": self.backend.bytes_held,
+        }
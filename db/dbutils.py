@@ -1,37 +1,158 @@
 import time
+import random
+import asyncio
 import logging
-from typing import Callable, Any
+import functools
+from typing import Callable, Any, Tuple, Type
+
+from .exceptions import CircuitOpenError, ConnectionError, RetryExhaustedError
+from .instrumentation import current_metrics
 
 logger = logging.getLogger(__name__)
 
-def with_retry(
-        func: Callable,
-        max_retries: int = 3,
-        initial_delay: float = 0.5,
-        backoff_factor: float = 2,
-        retryable_errors: tuple = (ConnectionError,),
-        logger: logging.Logger = logger
-) -> Callable:
-    async def wrapper(*args, **kwargs):
+class RetryBudget:
+    """Token bucket shared by every call of one AsyncDB instance.
+
+    Each retry spends a token and each successful call earns back a
+    fraction of one, so during an outage the instance as a whole stops
+    retrying instead of every coroutine retrying in lockstep.
+    """
+    def __init__(self, capacity: float = 20.0, refill_per_success: float = 0.1):
+        self.capacity = capacity
+        self.refill_per_success = refill_per_success
+        self.tokens = capacity
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def deposit(self) -> None:
+        self.tokens = min(self.capacity, self.tokens + self.refill_per_success)
+
+class CircuitBreaker:
+    """Fails fast after repeated connection failures, then half-opens to probe.
+
+    While open every call is rejected. After ``reset_timeout`` seconds a
+    single call is let through: success closes the circuit, another
+    connection failure opens it again, and a probe that is cancelled
+    before either frees the slot for the next caller.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probing = False
+            logger.info("Circuit half-open, probing backend")
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        if self.state != self.CLOSED:
+            logger.info("Circuit closed, backend recovered")
+            self.state = self.CLOSED
+            self._probing = False
+
+    def release(self) -> None:
+        """Free the probe slot of a call that ended without a verdict"""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self.failures >= self.failure_threshold
+        ):
+            logger.error(f"Circuit opened after {self.failures} connection failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probing = False
+
+class RetryPolicy:
+    """Retries with decorrelated jitter, a shared retry budget and a circuit breaker"""
+    def __init__(
+            self,
+            max_retries: int = 3,
+            base_delay: float = 0.5,
+            max_delay: float = 10.0,
+            retryable_errors: Tuple[Type[Exception], ...] = (ConnectionError,),
+            budget: RetryBudget = None,
+            breaker: CircuitBreaker = None
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable_errors = retryable_errors
+        self.budget = budget or RetryBudget()
+        self.breaker = breaker or CircuitBreaker()
+
+    def next_delay(self, delay: float) -> float:
+        """Decorrelated jitter: uniform between the base and three times the last delay"""
+        return min(self.max_delay, random.uniform(self.base_delay, delay * 3))
+
+    async def call(self, func: Callable, *args, **kwargs) -> Any:
         retries = 0
-        delay = initial_delay
+        delay = self.base_delay
 
-        while retries <= max_retries:
+        while True:
+            if not self.breaker.allow():
+                raise CircuitOpenError("Circuit open: backend marked unavailable")
+            probing = self.breaker.state == CircuitBreaker.HALF_OPEN
             try:
-                return await func(*args, **kwargs)
-            except retryable_errors as e:
-                if retries >= max_retries:
-                    logger.error(f"Retry exhausted after {max_retries} attempts")
+                result = await func(*args, **kwargs)
+            except self.retryable_errors as e:
+                self.breaker.record_failure()
+                if retries >= self.max_retries:
+                    logger.error(f"Retry exhausted after {self.max_retries} attempts")
+                    raise RetryExhaustedError from e
+                if not self.budget.withdraw():
+                    logger.error("Retry budget exhausted, not retrying")
                     raise RetryExhaustedError from e
 
                 retries += 1
+                metrics = current_metrics.get()
+                if metrics is not None:
+                    metrics.retries += 1
+                delay = self.next_delay(delay)
                 logger.warning(
                     f"Retryable error: {str(e)}. "
-                    f"Retrying in {delay:.2f}s (attempt {retries}/{max_retries})"
+                    f"Retrying in {delay:.2f}s (attempt {retries}/{self.max_retries})"
                 )
                 await asyncio.sleep(delay)
-                delay *= backoff_factor
             except Exception as e:
+                # The backend answered, so it counts as reachable
+                self.breaker.record_success()
                 logger.error(f"Non-retryable error: {str(e)}")
                 raise
-    return wrapper
\ No newline at end of file
+            except BaseException:
+                # Cancelled (timeout, client gone): no verdict on the backend
+                if probing:
+                    self.breaker.release()
+                raise
+            else:
+                self.breaker.record_success()
+                self.budget.deposit()
+                return result
+
+def with_retry(func: Callable) -> Callable:
+    """Run an AsyncDB coroutine method under the instance's ``retry_policy``"""
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        return await self.retry_policy.call(func, self, *args, **kwargs)
+    return wrapper
@@ -7,5 +7,8 @@ class ConnectionError(DatabaseError):
 class QueryExecutionError(DatabaseError):
     """Query execution errors"""
 
-class RetryExhaustedError(DatabaseError):
-    """All retry attempts exhausted"""
\ No newline at end of file
+class RetryExhaustedError(ConnectionError):
+    """All retry attempts exhausted while the connection kept failing"""
+
+class CircuitOpenError(ConnectionError):
+    """Backend marked unavailable; call rejected without trying"""
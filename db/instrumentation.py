@@ -0,0 +1,141 @@
+import functools
+import logging
+import re
+import time
+from collections import deque
+from collections.abc import Mapping, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class QueryMetrics:
+    """Measurements for one instrumented AsyncDB call (retries included)"""
+    operation: str
+    statement: str
+    wall_time: float = 0.0
+    rows: Optional[int] = None
+    retries: int = 0
+    pool_wait: float = 0.0
+    error: Optional[str] = None
+
+# Set while an instrumented call runs so with_retry and the pool can report into it
+current_metrics: ContextVar[Optional[QueryMetrics]] = ContextVar("current_metrics", default=None)
+
+class QueryHook:
+    """Receives a QueryMetrics for every instrumented AsyncDB call"""
+    def on_query(self, metrics: QueryMetrics) -> None:
+        raise NotImplementedError
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+@functools.lru_cache(maxsize=1024)
+def normalize_statement(query: str) -> str:
+    """Collapse literals and whitespace so variants of a statement share stats"""
+    statement = _LITERALS.sub("?", query)
+    statement = _IN_LISTS.sub("(?)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+class LatencyHistogram:
+    """Latencies of the most recent ``window`` executions of one statement"""
+    def __init__(self, window: int = 1024):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.rows = 0
+        self.retries = 0
+        self.errors = 0
+
+    def add(self, metrics: QueryMetrics) -> None:
+        self.samples.append(metrics.wall_time)
+        self.count += 1
+        self.rows += metrics.rows or 0
+        self.retries += metrics.retries
+        self.errors += metrics.error is not None
+
+    def percentile(self, pct: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": max(self.samples, default=0.0),
+            "rows": self.rows,
+            "retries": self.retries,
+            "errors": self.errors,
+        }
+
+class QueryStats(QueryHook):
+    """Rolling per-statement latency histograms plus a slow-query log"""
+    def __init__(self, slow_query_threshold: Optional[float] = 1.0, window: int = 1024):
+        self.slow_query_threshold = slow_query_threshold
+        self.window = window
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def on_query(self, metrics: QueryMetrics) -> None:
+        histogram = self.histograms.get(metrics.statement)
+        if histogram is None:
+            histogram = self.histograms[metrics.statement] = LatencyHistogram(self.window)
+        histogram.add(metrics)
+
+        if self.slow_query_threshold is not None and metrics.wall_time >= self.slow_query_threshold:
+            logger.warning(
+                f"Slow {metrics.operation} ({metrics.wall_time:.3f}s, rows={metrics.rows}, "
+                f"retries={metrics.retries}, pool_wait={metrics.pool_wait:.3f}s): "
+                f"{metrics.statement}"
+            )
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        return {statement: h.summary() for statement, h in self.histograms.items()}
+
+def _count_rows(result: Any) -> Optional[int]:
+    if result is None:
+        return 0
+    if isinstance(result, int):
+        # Drivers report -1 when the affected row count is unknown
+        return result if result >= 0 else None
+    if isinstance(result, Mapping):
+        return 1
+    if isinstance(result, Sequence):
+        return len(result)
+    return None
+
+def instrumented(operation: str) -> Callable:
+    """Report an AsyncDB coroutine method to ``self.instrumentation``.
+
+    Costs one attribute check when no hook is configured. Nested calls
+    (fetch_one -> fetch_all -> execute) are reported once, by the outermost.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            hook = self.instrumentation
+            if hook is None or current_metrics.get() is not None:
+                return await func(self, *args, **kwargs)
+
+            query = args[0] if args else kwargs.get("query", "")
+            metrics = QueryMetrics(operation, normalize_statement(query))
+            token = current_metrics.set(metrics)
+            start = time.perf_counter()
+            try:
+                result = await func(self, *args, **kwargs)
+                metrics.rows = _count_rows(result)
+                return result
+            except Exception as e:
+                metrics.error = type(e).__name__
+                raise
+            finally:
+                metrics.wall_time = time.perf_counter() - start
+                current_metrics.reset(token)
+                hook.on_query(metrics)
+        return wrapper
+    return decorator
@@ -1,8 +1,17 @@
+import logging
+from typing import Any, List, Sequence, Tuple
+
 import oracledb
+from sqlalchemy import event
 from .base import AsyncDB
-from .exceptions import ConnectionError, QueryExecutionError
+from .bulk import Row
+from .exceptions import ConnectionError, DatabaseError, QueryExecutionError
+
+logger = logging.getLogger(__name__)
 
 class OracleDB(AsyncDB):
+    ping_query = "SELECT 1 FROM DUAL"
+
     def __init__(
             self,
             username: str,
@@ -11,6 +20,10 @@ class OracleDB(AsyncDB):
             port: int = 1521,
             service_name: str = None,
             sid: str = None,
+            arraysize: int = None,
+            prefetchrows: int = None,
+            stmtcachesize: int = None,
+            replicas: Sequence[str] = (),
             **kwargs
     ):
         if not service_name and not sid:
@@ -23,14 +36,75 @@ class OracleDB(AsyncDB):
         # Create connection string
         conn_str = f"oracle+oracledb://{username}:{password}@{dsn}"
 
+        # Replicas are given as host:port/service and share the credentials
+        kwargs["replica_dsns"] = [
+            f"oracle+oracledb://{username}:{password}@{replica}" for replica in replicas
+        ]
+
+        # Rows fetched per round trip on every cursor
+        if arraysize:
+            kwargs["arraysize"] = arraysize
+        self.prefetchrows = prefetchrows
+
+        # Statements kept prepared per connection by the driver
+        if stmtcachesize is not None:
+            kwargs.setdefault("connect_args", {})["stmtcachesize"] = stmtcachesize
+
         super().__init__(conn_str, **kwargs)
 
+        if prefetchrows is not None:
+            # arraysize reaches the replicas through the shared engine kwargs; this must be added to each
+            for engine in [self.engine] + [replica.engine for replica in self.replicas.replicas]:
+                event.listen(engine.sync_engine, "before_cursor_execute", self._tune_stream_cursor)
+
+    def _tune_stream_cursor(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        """Size the fetch buffers of server-side cursors opened by ``stream``"""
+        if context is None or not context.execution_options.get("stream_results"):
+            return
+        raw_cursor = getattr(cursor, "_cursor", cursor)
+        batch_size = context.execution_options.get("yield_per")
+        if batch_size and batch_size > raw_cursor.arraysize:
+            raw_cursor.arraysize = batch_size
+        raw_cursor.prefetchrows = self.prefetchrows
+
+    async def _insert_chunk(
+            self,
+            table: str,
+            columns: Sequence[str],
+            chunk: List[Row]
+    ) -> Tuple[int, List[Any]]:
+        """Array DML through executemany; rejected rows are collected as batch errors"""
+        binds = ", ".join(f":{i}" for i in range(1, len(columns) + 1))
+        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({binds})"
+        data = [tuple(row[c] for c in columns) for row in chunk]
+
+        async with self.engine.connect() as conn:
+            raw_conn = (await conn.get_raw_connection()).driver_connection
+            cursor = raw_conn.cursor()
+            try:
+                await cursor.executemany(query, data, batcherrors=True)
+                errors = cursor.getbatcherrors()
+                await raw_conn.commit()
+            finally:
+                cursor.close()
+
+        for error in errors:
+            logger.warning(f"Bulk insert into {table} rejected row {error.offset}: {error.message}")
+        return len(data) - len(errors), errors
+
     def _handle_exception(self, e: Exception) -> None:
-        if isinstance(e, oracledb.DatabaseError):
-            error = e.args[0]
+        driver_error = self._driver_error(e)
+        if isinstance(driver_error, oracledb.Error):
+            error = driver_error.args[0]
             logger.error(f"Oracle error: {error.code} - {error.message}")
-            if error.code in (28, 1013, 1033, 1034, 1089, 3113, 3114, 3135):
+            # Thin-mode connect failures (DPY-6005 ...) carry no ORA code but are OperationalErrors
+            if error.code in (28, 1013, 1033, 1034, 1089, 3113, 3114, 3135) or isinstance(
+                    driver_error, (oracledb.OperationalError, oracledb.InterfaceError)
+            ):
                 raise ConnectionError from e
             raise QueryExecutionError from e
+        if self._is_connection_failure(e):
+            logger.error(f"Oracle connection failed: {driver_error!r}")
+            raise ConnectionError from e
         logger.exception("Unexpected error during query execution")
-        raise DatabaseError from e
\ No newline at end of file
+        raise DatabaseError from e
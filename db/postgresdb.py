@@ -1,7 +1,11 @@
-import asyncpg
-from sqlalchemy.exc import DBAPIError
+import logging
+from typing import Any, List, Sequence, Tuple
+
 from .base import AsyncDB
-from .exceptions import ConnectionError, QueryExecutionError
+from .bulk import Row
+from .exceptions import ConnectionError, DatabaseError, QueryExecutionError
+
+logger = logging.getLogger(__name__)
 
 class PostgresDB(AsyncDB):
     def __init__(
@@ -11,16 +15,53 @@ class PostgresDB(AsyncDB):
             host: str,
             port: int = 5432,
             database: str = "postgres",
+            statement_cache_size: int = None,
+            replicas: Sequence[str] = (),
             **kwargs
     ):
         # Create connection string
         conn_str = f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{database}"
+
+        # Replicas are given as host:port/database and share the credentials
+        kwargs["replica_dsns"] = [
+            f"postgresql+asyncpg://{username}:{password}@{replica}" for replica in replicas
+        ]
+
+        # Prepared statements kept per connection, both by asyncpg and by the
+        # SQLAlchemy adapter that prepares on its behalf; 0 disables (pgbouncer)
+        if statement_cache_size is not None:
+            connect_args = kwargs.setdefault("connect_args", {})
+            connect_args["statement_cache_size"] = statement_cache_size
+            connect_args["prepared_statement_cache_size"] = statement_cache_size
         super().__init__(conn_str, **kwargs)
 
+    async def _insert_chunk(
+            self,
+            table: str,
+            columns: Sequence[str],
+            chunk: List[Row]
+    ) -> Tuple[int, List[Any]]:
+        """Binary COPY through asyncpg's copy_records_to_table"""
+        schema_name, _, table_name = table.rpartition(".")
+        records = [tuple(row[c] for c in columns) for row in chunk]
+
+        async with self.engine.connect() as conn:
+            raw_conn = (await conn.get_raw_connection()).driver_connection
+            async with raw_conn.transaction():
+                await raw_conn.copy_records_to_table(
+                    table_name,
+                    records=records,
+                    columns=list(columns),
+                    schema_name=schema_name or None
+                )
+        return len(records), []
+
     def _handle_exception(self, e: Exception) -> None:
-        if isinstance(e, DBAPIError) and isinstance(e.orig, asyncpg.PostgresError):
-            pg_error = e.orig
-            logger.error(f"PostgreSQL error: {pg_error.code} - {pg_error.message}")
+        # SQLAlchemy's asyncpg adapter errors carry the SQLSTATE, as do asyncpg's own
+        pg_error = self._driver_error(e)
+        sqlstate = getattr(pg_error, "sqlstate", None)
+        if sqlstate:
+            logger.error(f"PostgreSQL error: {sqlstate} - {pg_error}")
 
             # Connection-related error codes
             connection_errors = [
@@ -28,8 +69,11 @@ class PostgresDB(AsyncDB):
                 '08P01', '57P01', '57P02', '57P03', '58P01'
             ]
 
-            if pg_error.code in connection_errors:
+            if sqlstate in connection_errors:
                 raise ConnectionError from e
             raise QueryExecutionError from e
+        if self._is_connection_failure(e):
+            logger.error(f"PostgreSQL connection failed: {pg_error!r}")
+            raise ConnectionError from e
         logger.exception("Unexpected error during query execution")
         raise DatabaseError from e
\ No newline at end of file
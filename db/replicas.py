@@ -0,0 +1,89 @@
+import asyncio
+import itertools
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+BALANCING_STRATEGIES = ("round_robin", "least_outstanding")
+
+class Replica:
+    """A read-only engine plus its load and health state"""
+    def __init__(self, dsn: str, engine: AsyncEngine, async_session: Callable):
+        self.dsn = dsn
+        self.engine = engine
+        self.async_session = async_session
+        self.outstanding = 0
+        self.healthy = True
+
+    @property
+    def name(self) -> str:
+        # Never log credentials
+        return self.dsn.rpartition("@")[2]
+
+class ReplicaSet:
+    """Balances reads across replicas and probes ejected ones until they recover"""
+    def __init__(
+            self,
+            replicas: Sequence[Replica],
+            *,
+            balancing: str = "round_robin",
+            health_check: Callable[[Replica], Awaitable[None]],
+            health_interval: float = 30.0
+    ):
+        if balancing not in BALANCING_STRATEGIES:
+            raise ValueError(f"balancing must be one of {BALANCING_STRATEGIES}")
+        self.replicas: List[Replica] = list(replicas)
+        self.balancing = balancing
+        self.health_check = health_check
+        self.health_interval = health_interval
+        self._round_robin = itertools.count()
+        self._probes: Dict[Replica, asyncio.Task] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def acquire(self) -> Optional[Replica]:
+        """Pick a healthy replica, or None when every replica is ejected"""
+        healthy = [r for r in self.replicas if r.healthy]
+        if not healthy:
+            return None
+        if self.balancing == "least_outstanding":
+            replica = min(healthy, key=lambda r: r.outstanding)
+        else:
+            replica = healthy[next(self._round_robin) % len(healthy)]
+        replica.outstanding += 1
+        return replica
+
+    def release(self, replica: Replica) -> None:
+        replica.outstanding -= 1
+
+    def eject(self, replica: Replica) -> None:
+        if not replica.healthy:
+            return
+        replica.healthy = False
+        logger.warning(f"Ejected read replica {replica.name}")
+        self._probes[replica] = asyncio.create_task(self._probe(replica))
+
+    async def _probe(self, replica: Replica) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self.health_check(replica)
+            except Exception as e:
+                logger.debug(f"Read replica {replica.name} still unhealthy: {str(e)}")
+                continue
+            replica.healthy = True
+            self._probes.pop(replica, None)
+            logger.info(f"Read replica {replica.name} restored")
+            return
+
+    async def close(self) -> None:
+        for probe in self._probes.values():
+            probe.cancel()
+        await asyncio.gather(*self._probes.values(), return_exceptions=True)
+        self._probes.clear()
+        for replica in self.replicas:
+            await replica.engine.dispose()
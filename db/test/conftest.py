@@ -5,7 +5,9 @@ from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine
 
 @pytest.fixture
 def mock_async_session():
-    return AsyncMock(spec=AsyncSession)
+    session = AsyncMock(spec=AsyncSession)
+    session.__aenter__.return_value = session
+    return session
 
 @pytest.fixture
 def mock_engine(mock_async_session):
@@ -21,20 +23,23 @@ def mock_sessionmaker(mock_async_session):
 def oracle_db(mock_engine, mock_sessionmaker, monkeypatch):
     # Mock SQLAlchemy engine creation
     monkeypatch.setattr(
-        "sqlalchemy.ext.asyncio.create_async_engine",
+        "db.base.create_async_engine",
         MagicMock(return_value=mock_engine)
     )
 
     # Mock sessionmaker
     monkeypatch.setattr(
-        "sqlalchemy.orm.sessionmaker",
+        "db.base.sessionmaker",
         MagicMock(return_value=mock_sessionmaker)
     )
 
+    from db.dbutils import RetryPolicy
     from db.oracle import OracleDB
     return OracleDB(
         username="test",
         password="test",
         host="localhost",
-        service_name="ORCL"
+        service_name="ORCL",
+        # No backoff sleeps in tests
+        retry_policy=RetryPolicy(base_delay=0, max_delay=0)
     )
\ No newline at end of file
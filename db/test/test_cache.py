@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from db.cache import DiskCacheBackend, MemoryCacheBackend, ResultCache, table_tags
+
+CONCEPT_QUERY = "SELECT table_name, description FROM WL_APP.WL_DATA_CONCEPT WHERE domain = :domain"
+
+def _mock_rows(mock_async_session, rows):
+    mock_result = MagicMock()
+    mock_result.mappings.return_value.all.return_value = rows
+    mock_async_session.execute = AsyncMock(return_value=mock_result)
+
+@pytest.mark.asyncio
+async def test_fetch_all_read_through(oracle_db, mock_async_session):
+    # Setup
+    oracle_db.result_cache = ResultCache()
+    _mock_rows(mock_async_session, [{"table_name": "LOAN"}])
+
+    # Execute
+    first = await oracle_db.fetch_all(CONCEPT_QUERY, {"domain": "lending"}, cache_ttl=60)
+    second = await oracle_db.fetch_all(CONCEPT_QUERY, {"domain": "lending"}, cache_ttl=60)
+    other = await oracle_db.fetch_one(CONCEPT_QUERY, {"domain": "risk"}, cache_ttl=60)
+
+    # Verify
+    assert first == second == [{"table_name": "LOAN"}]
+    assert other == {"table_name": "LOAN"}
+    assert mock_async_session.execute.await_count == 2
+    stats = oracle_db.result_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["bytes_held"] > 0
+
+@pytest.mark.asyncio
+async def test_fetch_all_uncached_without_ttl(oracle_db, mock_async_session):
+    # Setup
+    oracle_db.result_cache = ResultCache()
+    _mock_rows(mock_async_session, [{"id": 1}])
+
+    # Execute
+    await oracle_db.fetch_all("SELECT * FROM users")
+    await oracle_db.fetch_all("SELECT * FROM users")
+
+    # Verify
+    assert mock_async_session.execute.await_count == 2
+    assert oracle_db.result_cache.stats()["hits"] == 0
+
+@pytest.mark.asyncio
+async def test_invalidate_by_table(oracle_db, mock_async_session):
+    # Setup
+    oracle_db.result_cache = ResultCache(default_ttl=3600)
+    _mock_rows(mock_async_session, [{"table_name": "LOAN"}])
+    await oracle_db.fetch_all(CONCEPT_QUERY, {"domain": "lending"})
+
+    # Execute
+    removed = oracle_db.invalidate_cache("wl_data_concept")
+    await oracle_db.fetch_all(CONCEPT_QUERY, {"domain": "lending"})
+
+    # Verify
+    assert removed == 1
+    assert mock_async_session.execute.await_count == 2
+
+def test_table_tags():
+    assert table_tags(CONCEPT_QUERY) == {"WL_APP.WL_DATA_CONCEPT", "WL_DATA_CONCEPT"}
+    assert table_tags("SELECT * FROM a JOIN b ON a.id = b.id") == {"A", "B"}
+
+def test_memory_backend_lru_and_ttl():
+    # Setup
+    backend = MemoryCacheBackend(max_bytes=10)
+    backend.set("a", b"12345", ttl=60, tags=["T"])
+    backend.set("b", b"12345", ttl=60, tags=["T"])
+    backend.get("a")
+
+    # Execute: "b" is least recently used and gets evicted
+    backend.set("c", b"12345", ttl=60, tags=[])
+
+    # Verify
+    assert backend.get("b") is None
+    assert backend.get("a") == b"12345"
+    assert backend.bytes_held == 10
+
+    # Expired entries are misses
+    backend.set("d", b"1", ttl=-1, tags=[])
+    assert backend.get("d") is None
+
+def test_disk_backend_shared_between_processes(tmp_path):
+    # Setup: two handles on one file stand in for two worker processes
+    path = str(tmp_path / "results.db")
+    writer = DiskCacheBackend(path, max_bytes=10)
+    reader = DiskCacheBackend(path, max_bytes=10)
+
+    # Execute
+    writer.set("a", b"12345", ttl=60, tags=["WL_DATA_CONCEPT"])
+    writer.set("b", b"12345", ttl=60, tags=[])
+    reader.get("a")
+    writer.set("c", b"12345", ttl=60, tags=[])
+
+    # Verify LRU eviction and invalidation across handles
+    assert reader.get("b") is None
+    assert reader.get("a") == b"12345"
+    assert reader.invalidate("WL_DATA_CONCEPT") == 1
+    assert writer.get("a") is None
+    assert writer.bytes_held == 5
+    writer.close()
+    reader.close()
+
+@pytest.mark.asyncio
+async def test_disk_backend_runs_off_event_loop(oracle_db, mock_async_session, tmp_path):
+    # Setup
+    backend = DiskCacheBackend(str(tmp_path / "results.db"))
+    oracle_db.result_cache = ResultCache(backend)
+    _mock_rows(mock_async_session, [{"table_name": "LOAN"}])
+    threads = []
+    get, set_ = backend.get, backend.set
+    backend.get = lambda *args: threads.append(threading.get_ident()) or get(*args)
+    backend.set = lambda *args: threads.append(threading.get_ident()) or set_(*args)
+
+    # Execute
+    first = await oracle_db.fetch_all(CONCEPT_QUERY, {"domain": "lending"}, cache_ttl=60)
+    second = await oracle_db.fetch_all(CONCEPT_QUERY, {"domain": "lending"}, cache_ttl=60)
+
+    # Verify
+    assert first == second == [{"table_name": "LOAN"}]
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
+    backend.close()
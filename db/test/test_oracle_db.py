@@ -1,6 +1,7 @@
+import asyncio
 import pytest
 import oracledb
-from unittest.mock import call, MagicMock
+from unittest.mock import call, AsyncMock, MagicMock
 from sqlalchemy import text
 from db.exceptions import ConnectionError, QueryExecutionError, RetryExhaustedError
 
@@ -309,4 +310,333 @@ async def test_session_rollback(oracle_db, mock_async_session):
         await oracle_db.execute("INVALID SQL")
 
     # Verify rollback was called
-    mock_async_session.rollback.assert_awaited_once()
\ No newline at end of file
+    mock_async_session.rollback.assert_awaited_once()
+
+def _async_batches(batches):
+    async def gen(size):
+        for batch in batches:
+            yield batch
+    return gen
+
+@pytest.mark.asyncio
+async def test_stream_yields_batches(oracle_db, mock_async_session):
+    # Setup
+    mock_result = MagicMock()
+    mock_result.mappings.return_value.partitions = _async_batches(
+        [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    )
+    mock_async_session.stream = AsyncMock(return_value=mock_result)
+    query = "SELECT * FROM y14_run"
+
+    # Execute
+    batches = [batch async for batch in oracle_db.stream(query, batch_size=2)]
+
+    # Verify
+    assert batches == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+    _, kwargs = mock_async_session.stream.call_args
+    assert kwargs["execution_options"] == {"yield_per": 2}
+
+@pytest.mark.asyncio
+async def test_stream_error(oracle_db, mock_async_session):
+    # Setup
+    mock_async_session.stream = AsyncMock(
+        side_effect=oracledb.DatabaseError(MagicMock(code=942))
+    )
+
+    # Execute and verify
+    with pytest.raises(QueryExecutionError):
+        async for _ in oracle_db.stream("SELECT * FROM missing_table"):
+            pass
+
+    # Streams are never retried
+    assert mock_async_session.stream.call_count == 1
+
+@pytest.mark.asyncio
+async def test_bulk_insert_chunks(oracle_db):
+    # Setup
+    oracle_db._insert_chunk = AsyncMock(side_effect=lambda table, columns, chunk: (len(chunk), []))
+
+    async def rows():
+        for i in range(5):
+            yield {"id": i, "name": f"row{i}"}
+
+    # Execute
+    stats = await oracle_db.bulk_insert("users", rows(), chunk_size=2)
+
+    # Verify
+    assert stats.rows == 5
+    assert stats.chunks == 3
+    assert stats.errors == []
+    sizes = [len(c.args[2]) for c in oracle_db._insert_chunk.await_args_list]
+    assert sizes == [2, 2, 1]
+    assert oracle_db._insert_chunk.await_args_list[0].args[1] == ["id", "name"]
+
+@pytest.mark.asyncio
+async def test_bulk_insert_reports_batch_errors(oracle_db):
+    # Setup
+    batch_error = MagicMock(offset=1, message="ORA-00001: unique constraint violated")
+    oracle_db._insert_chunk = AsyncMock(return_value=(1, [batch_error]))
+
+    # Execute
+    stats = await oracle_db.bulk_insert("users", [{"id": 1}, {"id": 1}])
+
+    # Verify
+    assert stats.rows == 1
+    assert stats.errors == [batch_error]
+
+@pytest.mark.asyncio
+async def test_text_cache_reuses_text_clause(oracle_db, mock_async_session):
+    # Setup
+    mock_async_session.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+    query = "SELECT * FROM users WHERE id = :id"
+
+    # Execute
+    await oracle_db.execute(query, {"id": 1})
+    await oracle_db.execute(query, {"id": 2})
+
+    # Verify
+    first, second = mock_async_session.execute.await_args_list
+    assert first.args[0] is second.args[0]
+    stats = oracle_db.text_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+@pytest.mark.asyncio
+async def test_pool_configuration(oracle_db):
+    # Setup
+    import db.base
+    from db.oracle import OracleDB
+    from db.pool import TimedQueuePool
+
+    # Execute
+    OracleDB(
+        username="test",
+        password="test",
+        host="localhost",
+        service_name="ORCL",
+        pool_size=20,
+        pool_pre_ping=True,
+        pool_use_lifo=True
+    )
+
+    # Verify
+    _, kwargs = db.base.create_async_engine.call_args
+    assert kwargs["poolclass"] is TimedQueuePool
+    assert kwargs["pool_size"] == 20
+    assert kwargs["max_overflow"] == 10
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["pool_use_lifo"] is True
+
+@pytest.mark.asyncio
+async def test_pool_stats_untimed_pool(oracle_db, mock_engine):
+    # Setup
+    mock_engine.pool = MagicMock()
+    mock_engine.pool.status.return_value = "Pool size: 5"
+
+    # Execute and verify
+    assert oracle_db.pool_stats() == {"status": "Pool size: 5"}
+
+@pytest.mark.asyncio
+async def test_replica_balancing():
+    # Setup
+    from db.replicas import Replica, ReplicaSet
+    replicas = [
+        Replica(f"oracle+oracledb://u:p@replica{i}:1521/ORCL", MagicMock(), MagicMock())
+        for i in range(3)
+    ]
+    health_check = AsyncMock()
+
+    # Round robin cycles through healthy replicas
+    round_robin = ReplicaSet(replicas, health_check=health_check)
+    picked = [round_robin.acquire() for _ in range(4)]
+    assert picked == [replicas[0], replicas[1], replicas[2], replicas[0]]
+    for replica in picked:
+        round_robin.release(replica)
+
+    # Least outstanding avoids busy replicas
+    least = ReplicaSet(replicas, balancing="least_outstanding", health_check=health_check)
+    replicas[0].outstanding = 2
+    replicas[1].outstanding = 1
+    assert least.acquire() is replicas[2]
+
+    with pytest.raises(ValueError):
+        ReplicaSet(replicas, balancing="random", health_check=health_check)
+
+@pytest.mark.asyncio
+async def test_replica_ejected_on_connection_error(oracle_db, mock_async_session):
+    # Setup
+    from db.oracle import OracleDB
+    db = OracleDB(
+        username="test",
+        password="test",
+        host="primary",
+        service_name="ORCL",
+        replicas=["replica1:1521/ORCL"],
+        replica_health_interval=3600
+    )
+    mock_result = MagicMock()
+    mock_result.mappings.return_value.all.return_value = [{"id": 1}]
+    mock_async_session.execute = AsyncMock(side_effect=[
+        oracledb.DatabaseError(MagicMock(code=3113)),
+        mock_result
+    ])
+
+    # Execute: replica fails, query falls back to the primary
+    result = await db.fetch_all("SELECT * FROM users")
+
+    # Verify
+    assert result == [{"id": 1}]
+    replica = db.replicas.replicas[0]
+    assert replica.healthy is False
+    assert replica.outstanding == 0
+    assert db.replicas.acquire() is None
+    await db.close()
+
+@pytest.mark.asyncio
+async def test_gather_queries(oracle_db):
+    # Setup
+    running = 0
+    peak = 0
+
+    async def fake_fetch_one(query, params):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if params["id"] == 3:
+            raise QueryExecutionError()
+        return {"id": params["id"]}
+
+    oracle_db.fetch_one = fake_fetch_one
+    queries = [("SELECT * FROM facility WHERE id = :id", {"id": i}) for i in range(8)]
+
+    # Execute
+    results = await oracle_db.gather_queries(queries, max_concurrency=50, fetch_one=True)
+
+    # Verify order, per-query errors and the pool-size cap
+    assert [r["id"] for i, r in enumerate(results) if i != 3] == [0, 1, 2, 4, 5, 6, 7]
+    assert isinstance(results[3], QueryExecutionError)
+    assert peak == oracle_db.pool_size
+
+@pytest.mark.asyncio
+async def test_instrumentation_records_queries(oracle_db, mock_async_session, caplog):
+    # Setup
+    from db.instrumentation import QueryStats
+    oracle_db.instrumentation = QueryStats(slow_query_threshold=0.0)
+    mock_result = MagicMock()
+    mock_result.mappings.return_value.all.return_value = [{"id": 1}, {"id": 2}]
+    mock_async_session.execute = AsyncMock(return_value=mock_result)
+
+    # Execute
+    await oracle_db.fetch_one("SELECT * FROM users WHERE id = 1")
+    await oracle_db.fetch_one("SELECT *  FROM users WHERE id = 2")
+
+    # Verify: literal variants share one histogram, nested calls recorded once
+    summary = oracle_db.instrumentation.summary()
+    assert list(summary) == ["SELECT * FROM users WHERE id = ?"]
+    assert summary["SELECT * FROM users WHERE id = ?"]["count"] == 2
+    assert summary["SELECT * FROM users WHERE id = ?"]["rows"] == 2
+    assert "Slow fetch_one" in caplog.text
+
+@pytest.mark.asyncio
+async def test_instrumentation_records_errors(oracle_db, mock_async_session):
+    # Setup
+    from db.instrumentation import QueryHook
+    events = []
+
+    class Recorder(QueryHook):
+        def on_query(self, metrics):
+            events.append(metrics)
+
+    oracle_db.instrumentation = Recorder()
+    mock_async_session.execute = AsyncMock(
+        side_effect=oracledb.DatabaseError(MagicMock(code=942))
+    )
+
+    # Execute
+    with pytest.raises(QueryExecutionError):
+        await oracle_db.execute("SELECT * FROM missing_table")
+
+    # Verify
+    assert len(events) == 1
+    assert events[0].operation == "execute"
+    assert events[0].error == "QueryExecutionError"
+
+@pytest.mark.asyncio
+async def test_wrapped_and_checkout_connection_errors_retry(oracle_db, mock_async_session):
+    # Setup: SQLAlchemy wraps driver errors in DBAPIError; a refused checkout is a bare OSError
+    from sqlalchemy.exc import DBAPIError
+    mock_async_session.execute = AsyncMock(side_effect=[
+        DBAPIError("SELECT 1 FROM DUAL", {}, oracledb.DatabaseError(MagicMock(code=3113))),
+        ConnectionRefusedError(111, "Connect call failed"),
+        MagicMock(rowcount=1)
+    ])
+
+    # Execute
+    result = await oracle_db.execute("SELECT 1 FROM DUAL")
+
+    # Verify
+    assert result == 1
+    assert mock_async_session.execute.call_count == 3
+
+@pytest.mark.asyncio
+async def test_wrapped_query_error_not_retried(oracle_db, mock_async_session):
+    # Setup
+    from sqlalchemy.exc import DBAPIError
+    mock_async_session.execute = AsyncMock(
+        side_effect=DBAPIError("SELECT * FROM missing", {}, oracledb.DatabaseError(MagicMock(code=942)))
+    )
+
+    # Execute and verify exception
+    with pytest.raises(QueryExecutionError):
+        await oracle_db.execute("SELECT * FROM missing")
+    assert mock_async_session.execute.call_count == 1
+
+def test_prefetchrows_listener_on_replica_engines():
+    # Setup: real (unconnected) engines, one per replica
+    from sqlalchemy import event
+    from db.oracle import OracleDB
+    db = OracleDB(
+        username="test",
+        password="test",
+        host="primary",
+        service_name="ORCL",
+        prefetchrows=500,
+        replicas=["replica1:1521/ORCL", "replica2:1521/ORCL"]
+    )
+
+    # Verify
+    engines = [db.engine] + [replica.engine for replica in db.replicas.replicas]
+    assert len({id(engine) for engine in engines}) == 3
+    for engine in engines:
+        assert event.contains(engine.sync_engine, "before_cursor_execute", db._tune_stream_cursor)
+
+def _warmable_engine(error=None):
+    engine = MagicMock()
+    engine.pool.size.return_value = 2
+    engine.dispose = AsyncMock()
+    connection = MagicMock()
+    connection.__aenter__ = AsyncMock(side_effect=error)
+    connection.__aexit__ = AsyncMock(return_value=False)
+    engine.connect.return_value = connection
+    return engine
+
+@pytest.mark.asyncio
+async def test_warm_up_covers_replicas(oracle_db):
+    # Setup
+    from db.replicas import Replica
+    oracle_db.engine = _warmable_engine()
+    healthy = Replica("oracle+oracledb://u:p@replica1:1521/ORCL", _warmable_engine(), MagicMock())
+    down = Replica("oracle+oracledb://u:p@replica2:1521/ORCL", _warmable_engine(OSError("refused")), MagicMock())
+    oracle_db.replicas.replicas = [healthy, down]
+
+    # Execute
+    opened = await oracle_db.warm_up()
+
+    # Verify: primary and healthy replica warmed, the unreachable one ejected
+    assert opened == 4
+    assert oracle_db.engine.connect.call_count == 2
+    assert healthy.engine.connect.call_count == 2
+    assert down.healthy is False
+    await oracle_db.replicas.close()
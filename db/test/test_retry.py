@@ -0,0 +1,151 @@
+import asyncio
+import pytest
+import oracledb
+from unittest.mock import AsyncMock, MagicMock
+from db.dbutils import CircuitBreaker, RetryBudget, RetryPolicy
+from db.exceptions import CircuitOpenError, ConnectionError, RetryExhaustedError
+
+def _connection_lost():
+    return oracledb.DatabaseError(MagicMock(code=3113))
+
+def _failover(mock_async_session, failing_calls):
+    """Session that loses its connection for the first ``failing_calls`` executes"""
+    calls = 0
+
+    async def execute(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls <= failing_calls:
+            raise _connection_lost()
+        return MagicMock(rowcount=1)
+
+    mock_async_session.execute = AsyncMock(side_effect=execute)
+
+@pytest.mark.asyncio
+async def test_instance_max_retries_applied():
+    # Setup
+    from db.oracle import OracleDB
+    db = OracleDB(username="test", password="test", host="localhost", sid="XE", max_retries=1)
+
+    # Verify
+    assert db.retry_policy.max_retries == 1
+
+@pytest.mark.asyncio
+async def test_decorrelated_jitter_bounds():
+    # Setup
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+
+    # Execute
+    delay = policy.base_delay
+    delays = []
+    for _ in range(50):
+        delay = policy.next_delay(delay)
+        delays.append(delay)
+
+    # Verify
+    assert all(0.5 <= d <= 4.0 for d in delays)
+    assert len(set(delays)) > 1
+
+@pytest.mark.asyncio
+async def test_failover_storm_opens_circuit(oracle_db, mock_async_session):
+    # Setup: the primary is down for every call in the storm
+    oracle_db.retry_policy.breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+    mock_async_session.execute = AsyncMock(side_effect=_connection_lost())
+
+    # Execute: 50 coroutines hit the database at once
+    results = await asyncio.gather(
+        *(oracle_db.execute("SELECT 1 FROM DUAL") for _ in range(50)),
+        return_exceptions=True
+    )
+
+    # Verify: everyone fails with a connection error, most of them without touching the backend
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert any(isinstance(r, CircuitOpenError) for r in results)
+    assert oracle_db.retry_policy.breaker.state == CircuitBreaker.OPEN
+    assert mock_async_session.execute.call_count < 50 * 4
+
+@pytest.mark.asyncio
+async def test_retry_budget_limits_storm(oracle_db, mock_async_session):
+    # Setup: breaker out of the way, budget of 5 retries for the whole instance
+    oracle_db.retry_policy.breaker = CircuitBreaker(failure_threshold=10_000)
+    oracle_db.retry_policy.budget = RetryBudget(capacity=5)
+    mock_async_session.execute = AsyncMock(side_effect=_connection_lost())
+
+    # Execute
+    results = await asyncio.gather(
+        *(oracle_db.execute("SELECT 1 FROM DUAL") for _ in range(20)),
+        return_exceptions=True
+    )
+
+    # Verify: 20 first attempts plus at most 5 retries in total
+    assert all(isinstance(r, RetryExhaustedError) for r in results)
+    assert mock_async_session.execute.call_count == 20 + 5
+
+@pytest.mark.asyncio
+async def test_circuit_half_opens_and_recovers(oracle_db, mock_async_session):
+    # Setup: failover lasts for the first 5 calls
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0)
+    oracle_db.retry_policy.breaker = breaker
+    oracle_db.retry_policy.max_retries = 0
+    _failover(mock_async_session, failing_calls=5)
+
+    # Execute: trip the breaker
+    for _ in range(5):
+        with pytest.raises(ConnectionError):
+            await oracle_db.execute("SELECT 1 FROM DUAL")
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # After reset_timeout a single probe goes through and closes the circuit
+    result = await oracle_db.execute("SELECT 1 FROM DUAL")
+
+    # Verify
+    assert result == 1
+    assert breaker.state == CircuitBreaker.CLOSED
+
+@pytest.mark.asyncio
+async def test_half_open_allows_single_probe():
+    # Setup
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    # Execute and verify: only one caller probes, a failed probe reopens
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+@pytest.mark.asyncio
+async def test_retry_budget_refills_on_success():
+    # Setup
+    budget = RetryBudget(capacity=2, refill_per_success=0.5)
+
+    # Execute
+    assert budget.withdraw() and budget.withdraw()
+    assert budget.withdraw() is False
+    budget.deposit()
+    budget.deposit()
+
+    # Verify
+    assert budget.withdraw() is True
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_frees_half_open_slot():
+    # Setup: an open circuit whose probe hangs
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    policy = RetryPolicy(breaker=breaker)
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def ok():
+        return 1
+
+    # Execute: the probe times out, then the backend answers
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(policy.call(slow), timeout=0.01)
+    result = await policy.call(ok)
+
+    # Verify
+    assert result == 1
+    assert breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,236 @@
+"""Extract-once page text cache for the document classifier and summarizer.
+
+Each PDF is parsed a single time, in parallel across processes, and its
+normalized page text (lowercased, whitespace collapsed) is kept in one
+compact file per document, named by the PDF's content hash:
+
+    <store>/ab/abcdef....pages
+
+The file holds one zlib block per page, written as pages arrive, then a
+footer with every page's offset; it is renamed into place only when
+complete. Reading a page range decompresses just those pages.
+
+Usage:
+    python page_text_store.py path/to/agreement.pdf [...] [--store DIR] [--workers N]
+    python page_text_store.py graph-docs/Citibank-Amazon.pdf --benchmark
+"""
+import argparse
+import hashlib
+import mmap
+import multiprocessing
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+
+import PyPDF2
+
+DEFAULT_STORE = Path(__file__).parent / "page_text_store"
+PAGES_PER_JOB = 8
+
+_MAGIC = b"PTXT1"
+_FOOTER = struct.Struct("<5sI")  # magic, page count; preceded by count * (offset, length) pairs
+_ENTRY = struct.Struct("<QI")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def file_digest(path):
+    """SHA-256 of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def normalize_text(text):
+    return _WHITESPACE.sub(" ", text or "").strip().lower()
+
+
+def _extract_pages(pdf_path, start, end):
+    """Worker: normalized, compressed text of pages [start, end) from one parse of the file."""
+    reader = PyPDF2.PdfReader(pdf_path)
+    return start, [
+        zlib.compress(normalize_text(reader.pages[i].extract_text()).encode(), 6)
+        for i in range(start, end)
+    ]
+
+
+@lru_cache(maxsize=256)
+def _digest(path, mtime, size):
+    return file_digest(path)
+
+
+class _PageFile:
+    """Read-only view of one .pages file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.page_count = _FOOTER.unpack_from(self._data, len(self._data) - _FOOTER.size)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a page text file")
+        index_start = len(self._data) - _FOOTER.size - self.page_count * _ENTRY.size
+        self._index = [
+            _ENTRY.unpack_from(self._data, index_start + i * _ENTRY.size) for i in range(self.page_count)
+        ]
+
+    def page(self, number):
+        offset, length = self._index[number]
+        return zlib.decompress(self._data[offset:offset + length]).decode()
+
+
+class PageTextStore:
+    """Content-addressed store of extracted PDF page text.
+
+    At most ``max_open`` documents stay mapped, least recently used first
+    out; a dropped map is closed once no reader holds it any more.
+    """
+
+    def __init__(self, store_dir=DEFAULT_STORE, workers=None, max_open=64):
+        self.store_dir = Path(store_dir)
+        self.workers = workers
+        self.max_open = max_open
+        self._open = OrderedDict()  # digest -> _PageFile
+        self._lock = threading.Lock()
+
+    def path_for(self, digest):
+        return self.store_dir / digest[:2] / f"{digest}.pages"
+
+    def _pages(self, pdf_path):
+        stat = os.stat(pdf_path)
+        digest = _digest(str(pdf_path), stat.st_mtime, stat.st_size)
+        with self._lock:
+            pages = self._open.get(digest)
+            if pages is not None:
+                self._open.move_to_end(digest)
+                return pages
+        path = self.path_for(digest)
+        if not path.exists():
+            self.extract(pdf_path, digest)
+        pages = _PageFile(path)
+        with self._lock:
+            self._open[digest] = pages
+            while len(self._open) > self.max_open:
+                self._open.popitem(last=False)
+        return pages
+
+    def extract(self, pdf_path, digest=None):
+        """Parse every page once across a process pool and write the document's .pages file."""
+        digest = digest or file_digest(pdf_path)
+        path = self.path_for(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        page_count = len(PyPDF2.PdfReader(pdf_path).pages)
+        jobs = [(start, min(start + PAGES_PER_JOB, page_count)) for start in range(0, page_count, PAGES_PER_JOB)]
+        workers = max(1, min(self.workers or os.cpu_count() or 1, len(jobs)))
+
+        index = [None] * page_count
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                if workers == 1:
+                    results = (_extract_pages(str(pdf_path), start, end) for start, end in jobs)
+                    self._write_blocks(out, results, index)
+                else:
+                    # spawn, not fork: callers may be running inside an event loop or a UI thread
+                    context = multiprocessing.get_context("spawn")
+                    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                        futures = [pool.submit(_extract_pages, str(pdf_path), start, end) for start, end in jobs]
+                        # Blocks are written in completion order; the footer records where each page landed
+                        self._write_blocks(out, (f.result() for f in as_completed(futures)), index)
+                for offset, length in index:
+                    out.write(_ENTRY.pack(offset, length))
+                out.write(_FOOTER.pack(_MAGIC, page_count))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+
+    @staticmethod
+    def _write_blocks(out, results, index):
+        for start, blocks in results:
+            for i, block in enumerate(blocks):
+                index[start + i] = (out.tell(), len(block))
+                out.write(block)
+
+    def page_count(self, pdf_path):
+        return self._pages(pdf_path).page_count
+
+    def read_pages(self, pdf_path, start, end):
+        """Normalized text of pages [start, end), joined by spaces."""
+        pages = self._pages(pdf_path)
+        return " ".join(pages.page(i) for i in range(start, min(end, pages.page_count)))
+
+
+def benchmark(pdf_path, store_dir, workers, summary_pages=5, chunk_size=10):
+    """Page text access of the classifier + summarizer pipelines: per-chunk PyPDF2 vs. the store."""
+    def chunk_ranges(total_pages):
+        return [(0, summary_pages)] + [
+            (start, start + chunk_size) for start in range(summary_pages, total_pages, chunk_size)
+        ]
+
+    def reparse(start, end):
+        # The old extract_pages_text: a new reader for every range
+        with open(pdf_path, "rb") as file:
+            reader = PyPDF2.PdfReader(file)
+            end = min(end, len(reader.pages))
+            return " ".join(reader.pages[i].extract_text() or "" for i in range(start, end)).lower()
+
+    start_time = time.perf_counter()
+    for _pipeline in ("classify", "summarize"):
+        total_pages = len(PyPDF2.PdfReader(pdf_path).pages)
+        for start, end in chunk_ranges(total_pages):
+            reparse(start, end)
+    baseline = time.perf_counter() - start_time
+
+    store = PageTextStore(store_dir, workers=workers)
+    start_time = time.perf_counter()
+    for _pipeline in ("classify", "summarize"):
+        for start, end in chunk_ranges(store.page_count(pdf_path)):
+            store.read_pages(pdf_path, start, end)
+    cold = time.perf_counter() - start_time
+
+    store = PageTextStore(store_dir, workers=workers)
+    start_time = time.perf_counter()
+    for _pipeline in ("classify", "summarize"):
+        for start, end in chunk_ranges(store.page_count(pdf_path)):
+            store.read_pages(pdf_path, start, end)
+    warm = time.perf_counter() - start_time
+
+    pages = store._pages(pdf_path)
+    text_bytes = sum(len(pages.page(i).encode()) for i in range(pages.page_count))
+    cache_bytes = store.path_for(file_digest(pdf_path)).stat().st_size
+    print(f"{pdf_path}: {pages.page_count} pages, {len(chunk_ranges(pages.page_count))} ranges per pipeline")
+    print(f"  per-chunk PyPDF2, both pipelines: {baseline:8.2f} s")
+    print(f"  store, cold (extract + read):     {cold:8.2f} s")
+    print(f"  store, warm:                      {warm:8.3f} s")
+    print(f"  cache file {cache_bytes / 1024:.0f} KiB for {text_bytes / 1024:.0f} KiB of text")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract PDF page text into the page text store")
+    parser.add_argument("pdfs", nargs="+", help="PDF files to extract")
+    parser.add_argument("--store", default=str(DEFAULT_STORE), help="page text store directory")
+    parser.add_argument("--workers", type=int, default=None, help="extraction processes (default: CPU count)")
+    parser.add_argument("--benchmark", action="store_true", help="compare with per-chunk PyPDF2 extraction")
+    args = parser.parse_args()
+
+    for pdf_path in args.pdfs:
+        if args.benchmark:
+            with tempfile.TemporaryDirectory() as store_dir:
+                benchmark(pdf_path, store_dir, args.workers)
+            continue
+        store = PageTextStore(args.store, workers=args.workers)
+        print(f"{pdf_path}: {store.page_count(pdf_path)} pages")
+
+
+if __name__ == "__main__":
+    main()
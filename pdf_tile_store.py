@@ -0,0 +1,150 @@
+"""Pre-rendered page tile store for the credit agreement PDFs shown in creda_ui.py.
+
+Pages are rasterized once, in parallel across processes, into a
+content-addressed object store:
+
+    <store>/objects/ab/abcdef...png      page images and thumbnails (PNG)
+    <store>/manifests/<pdf sha256>-<zoom>-<thumbnail zoom>.json
+
+The manifest lists, per page, the object digest of the full image and
+of its thumbnail. It is written last, so a manifest that exists always
+points at complete objects.
+
+Usage:
+    python pdf_tile_store.py path/to/agreement.pdf [...] [--store DIR] [--workers N]
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import fitz
+
+DEFAULT_STORE = Path(__file__).parent / "tile_store"
+DEFAULT_ZOOM = 1.5
+DEFAULT_THUMBNAIL_ZOOM = 0.3
+
+
+def file_digest(path):
+    """SHA-256 of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_object(store_dir, data):
+    """Store bytes under their SHA-256 and return the digest."""
+    digest = hashlib.sha256(data).hexdigest()
+    path = Path(store_dir) / "objects" / digest[:2] / f"{digest}.png"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
+    return digest
+
+
+def _render_pages(pdf_path, page_numbers, zoom, thumbnail_zoom, store_dir):
+    """Worker: rasterize a share of the pages and write them straight into the store."""
+    entries = []
+    with fitz.open(pdf_path) as pdf_document:
+        for page_number in page_numbers:
+            page = pdf_document[page_number]
+            image = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+            thumbnail = page.get_pixmap(matrix=fitz.Matrix(thumbnail_zoom, thumbnail_zoom))
+            entries.append({
+                "page": page_number,
+                "width": image.width,
+                "height": image.height,
+                "image": _write_object(store_dir, image.tobytes("png")),
+                "thumbnail": _write_object(store_dir, thumbnail.tobytes("png")),
+            })
+    return entries
+
+
+class TileStore:
+    """Content-addressed store of rendered PDF pages."""
+
+    def __init__(self, store_dir=DEFAULT_STORE, zoom=DEFAULT_ZOOM, thumbnail_zoom=DEFAULT_THUMBNAIL_ZOOM):
+        self.store_dir = Path(store_dir)
+        self.zoom = zoom
+        self.thumbnail_zoom = thumbnail_zoom
+        (self.store_dir / "objects").mkdir(parents=True, exist_ok=True)
+        (self.store_dir / "manifests").mkdir(parents=True, exist_ok=True)
+
+    def manifest_path(self, pdf_digest):
+        return self.store_dir / "manifests" / f"{pdf_digest}-{self.zoom}-{self.thumbnail_zoom}.json"
+
+    def object_path(self, digest):
+        return self.store_dir / "objects" / digest[:2] / f"{digest}.png"
+
+    def load_manifest(self, pdf_path):
+        """Return the manifest for this PDF's current contents, or None if not rendered."""
+        path = self.manifest_path(file_digest(pdf_path))
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())
+
+    def prerender(self, pdf_path, workers=None):
+        """Render every page of a PDF into the store once, across a process pool."""
+        pdf_digest = file_digest(pdf_path)
+        manifest_path = self.manifest_path(pdf_digest)
+        if manifest_path.exists():
+            return json.loads(manifest_path.read_text())
+
+        start_time = time.perf_counter()
+        with fitz.open(pdf_path) as pdf_document:
+            page_count = len(pdf_document)
+
+        workers = max(1, min(workers or os.cpu_count() or 1, page_count))
+        # Interleave pages so every worker gets a similar mix of heavy and light pages
+        shares = [list(range(page_count))[i::workers] for i in range(workers)]
+
+        # spawn, not fork: the UI calls this from a Streamlit script thread
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [
+                pool.submit(_render_pages, str(pdf_path), share, self.zoom, self.thumbnail_zoom, str(self.store_dir))
+                for share in shares if share
+            ]
+            pages = sorted((entry for f in futures for entry in f.result()), key=lambda e: e["page"])
+
+        manifest = {
+            "source": str(pdf_path),
+            "sha256": pdf_digest,
+            "page_count": page_count,
+            "zoom": self.zoom,
+            "thumbnail_zoom": self.thumbnail_zoom,
+            "render_seconds": round(time.perf_counter() - start_time, 3),
+            "pages": pages,
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=manifest_path.parent)
+        with os.fdopen(fd, "w") as tmp:
+            json.dump(manifest, tmp, indent=2)
+        os.replace(tmp_path, manifest_path)
+        return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render PDF pages into the tile store")
+    parser.add_argument("pdfs", nargs="+", help="PDF files to render")
+    parser.add_argument("--store", default=str(DEFAULT_STORE), help="tile store directory")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    args = parser.parse_args()
+
+    store = TileStore(args.store)
+    for pdf_path in args.pdfs:
+        manifest = store.prerender(pdf_path, workers=args.workers)
+        print(f"{pdf_path}: {manifest['page_count']} pages, manifest {store.manifest_path(manifest['sha256'])}")
+
+
+if __name__ == "__main__":
+    main()